@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING, Any, Callable
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_ENTITIES, CONF_NAME, Platform
@@ -79,11 +80,15 @@ from .const import (
     CONF_WINDOW_TEMPERATURE,
     CONF_ZONE_OPEN_DELAY,
     CONF_ZONE_SENSOR,
+    CONFIG_ENTRY_VERSION,
     DOMAIN,
 )
 
+if TYPE_CHECKING:
+    from .climate import ClimateGroupHelper
+
 # Valid configuration keys for migration whitelist
-VALID_CONFIG_KEYS = {
+VALID_CONFIG_KEYS: frozenset[str] = frozenset({
     CONF_NAME,
     CONF_ENTITIES,
     CONF_ADVANCED_MODE,
@@ -171,36 +176,89 @@ VALID_CONFIG_KEYS = {
     # Per-member temperature offsets
     CONF_MEMBER_TEMP_OFFSETS,
     CONF_MEMBER_OFFSET_CORRECTION,
-}
+})
 
 # Track which platforms have been set up per entry
 SETUP_PLATFORMS = "setup_platforms"
 
+# Platforms forwarded in two stages: dependent platforms read the group reference
+# that the climate platform stores in hass.data.
+PRIMARY_PLATFORMS: tuple[Platform, ...] = (Platform.CLIMATE, Platform.SENSOR)
+DEPENDENT_PLATFORMS: tuple[Platform, ...] = (Platform.SWITCH, Platform.NUMBER)
+# Fallback for unload when no platforms were recorded
+_DEFAULT_PLATFORMS: tuple[Platform, ...] = (Platform.CLIMATE,)
+
 _LOGGER = logging.getLogger(__name__)
 
 
+# Renamed enum values: option key → {old value: new value}
+_LEGACY_VALUE_RENAMES: dict[str, dict[str, str]] = {
+    # v7 → v8: SyncMode.STANDARD → DISABLED
+    CONF_SYNC_MODE: {"standard": "disabled"},
+    # v8 → v9: WindowControlMode "off"/"on" → "disabled"/"enabled"
+    CONF_WINDOW_MODE: {"off": "disabled", "on": "enabled"},
+}
+
+
+def _migrate_v7_to_v8(options: dict[str, Any]) -> None:
+    """Split ignore_off_members into the sync and schedule variants."""
+    ignore_off = options.pop("ignore_off_members", False)
+    if CONF_IGNORE_OFF_MEMBERS_SYNC not in options:
+        options[CONF_IGNORE_OFF_MEMBERS_SYNC] = ignore_off
+    if CONF_IGNORE_OFF_MEMBERS_SCHEDULE not in options:
+        options[CONF_IGNORE_OFF_MEMBERS_SCHEDULE] = ignore_off
+
+
+def _migrate_legacy_values(options: dict[str, Any]) -> None:
+    """Rename legacy enum values (v7 → v9) in a single pass over _LEGACY_VALUE_RENAMES."""
+    for key, renames in _LEGACY_VALUE_RENAMES.items():
+        # Legacy values are plain strings; the str check keeps unhashable values out of the lookup
+        if isinstance(old := options.get(key), str) and old in renames:
+            options[key] = renames[old]
+
+
+def _migrate_v9_to_v10(options: dict[str, Any]) -> None:
+    """CONF_PRESENCE_SENSOR str → list[str]; add CONF_ADVANCED_MODE."""
+    presence_sensor = options.get(CONF_PRESENCE_SENSOR)
+    if isinstance(presence_sensor, str):
+        options[CONF_PRESENCE_SENSOR] = [presence_sensor]
+    if CONF_ADVANCED_MODE not in options:
+        options[CONF_ADVANCED_MODE] = True
+
+
+def _migrate_v10_to_v11(options: dict[str, Any]) -> None:
+    """CONF_RANGE_TEMPLATE_ENTITIES list → CONF_RANGE_TEMPLATE_ENABLED bool."""
+    if "range_template_entities" in options:
+        options[CONF_RANGE_TEMPLATE_ENABLED] = bool(options.pop("range_template_entities"))
+
+
+# Historical transformations, applied in order by the soft-reset migration.
+# Every step is idempotent, so all steps run regardless of the entry's version.
+_SOFT_RESET_STEPS: tuple[Callable[[dict[str, Any]], None], ...] = (
+    _migrate_v7_to_v8,
+    _migrate_legacy_values,
+    _migrate_v9_to_v10,
+    _migrate_v10_to_v11,
+)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Climate Group Helper from a config entry."""
 
-    # One-time migration for entries that have no options yet, moving all data to options
-    if not entry.options:
-        hass.config_entries.async_update_entry(entry, data={}, options=entry.data)
-
     # Initialize domain data
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(entry.entry_id, {})
-    hass.data[DOMAIN][entry.entry_id][SETUP_PLATFORMS] = set()
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data is None:
+        domain_data = hass.data[DOMAIN] = {}
+    entry_data = domain_data[entry.entry_id] = {SETUP_PLATFORMS: ()}
 
-    # Set up climate and sensor first — climate.async_setup_entry stores the group
+    # Set up climate and sensor first in one batch — climate.async_setup_entry stores the group
     # reference in hass.data, which switch.async_setup_entry depends on.
-    await hass.config_entries.async_forward_entry_setups(entry, [Platform.CLIMATE, Platform.SENSOR])
-    hass.data[DOMAIN][entry.entry_id][SETUP_PLATFORMS].add(Platform.CLIMATE)
-    hass.data[DOMAIN][entry.entry_id][SETUP_PLATFORMS].add(Platform.SENSOR)
+    await hass.config_entries.async_forward_entry_setups(entry, PRIMARY_PLATFORMS)
+    entry_data[SETUP_PLATFORMS] = PRIMARY_PLATFORMS
 
     # Set up switch and number after climate so the group reference is guaranteed to exist.
-    await hass.config_entries.async_forward_entry_setups(entry, [Platform.SWITCH, Platform.NUMBER])
-    hass.data[DOMAIN][entry.entry_id][SETUP_PLATFORMS].add(Platform.SWITCH)
-    hass.data[DOMAIN][entry.entry_id][SETUP_PLATFORMS].add(Platform.NUMBER)
+    await hass.config_entries.async_forward_entry_setups(entry, DEPENDENT_PLATFORMS)
+    entry_data[SETUP_PLATFORMS] = PRIMARY_PLATFORMS + DEPENDENT_PLATFORMS
 
     # Register update listener for options changes, which will trigger a reload
     entry.async_on_unload(entry.add_update_listener(_update_listener))
@@ -217,47 +275,35 @@ async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         - Filter out invalid configuration keys
         - Restore defaults for valid keys not present
     """
-    if entry.version < 11:
-        _LOGGER.info("[%s] Migrating config entry from version %s to 11", entry.title, entry.version)
-
-        # Combine data + options (covers pre-v7 entries that still used entry.data)
-        old_config = {**entry.data, **entry.options}
-
-        # v7 → v8: split ignore_off_members; rename SyncMode.STANDARD → DISABLED
-        ignore_off = old_config.pop("ignore_off_members", False)
-        if CONF_IGNORE_OFF_MEMBERS_SYNC not in old_config:
-            old_config[CONF_IGNORE_OFF_MEMBERS_SYNC] = ignore_off
-        if CONF_IGNORE_OFF_MEMBERS_SCHEDULE not in old_config:
-            old_config[CONF_IGNORE_OFF_MEMBERS_SCHEDULE] = ignore_off
-        if old_config.get(CONF_SYNC_MODE) == "standard":
-            old_config[CONF_SYNC_MODE] = "disabled"
-
-        # v8 → v9: WindowControlMode "off"/"on" → "disabled"/"enabled"
-        if old_config.get(CONF_WINDOW_MODE) == "off":
-            old_config[CONF_WINDOW_MODE] = "disabled"
-        elif old_config.get(CONF_WINDOW_MODE) == "on":
-            old_config[CONF_WINDOW_MODE] = "enabled"
-
-        # v9 → v10: CONF_PRESENCE_SENSOR str → list[str]; add CONF_ADVANCED_MODE
-        presence_sensor = old_config.get(CONF_PRESENCE_SENSOR)
-        if isinstance(presence_sensor, str):
-            old_config[CONF_PRESENCE_SENSOR] = [presence_sensor]
-        if CONF_ADVANCED_MODE not in old_config:
-            old_config[CONF_ADVANCED_MODE] = True
-
-        # v10 → v11: CONF_RANGE_TEMPLATE_ENTITIES list → CONF_RANGE_TEMPLATE_ENABLED bool
-        if "range_template_entities" in old_config:
-            old_config[CONF_RANGE_TEMPLATE_ENABLED] = bool(old_config.pop("range_template_entities"))
-
-        # Whitelist filter: discard all deprecated/renamed keys
-        new_options = {key: value for key, value in old_config.items() if key in VALID_CONFIG_KEYS}
-
-        # Ensure defaults for keys added in earlier versions
-        if CONF_EXPAND_SECTIONS not in new_options:
-            new_options[CONF_EXPAND_SECTIONS] = False
-
-        hass.config_entries.async_update_entry(entry, data={}, options=new_options, version=11)
-        _LOGGER.info("[%s] Migration to v11 complete. %d valid keys preserved.", entry.title, len(new_options))
+    if entry.version >= CONFIG_ENTRY_VERSION:
+        return True
+
+    _LOGGER.info("[%s] Migrating config entry from version %s to %s", entry.title, entry.version, CONFIG_ENTRY_VERSION)
+
+    # Combine data + options (covers pre-v7 entries that still used entry.data and
+    # entries without options — new entries are always created with options only)
+    options = dict(entry.data)
+    options.update(entry.options)
+
+    # Apply all historical transformations in order
+    for migrate in _SOFT_RESET_STEPS:
+        migrate(options)
+
+    # Whitelist filter: discard all deprecated/renamed keys
+    discarded_keys = options.keys() - VALID_CONFIG_KEYS
+    for key in discarded_keys:
+        del options[key]
+
+    # Ensure defaults for keys added in earlier versions
+    if CONF_EXPAND_SECTIONS not in options:
+        options[CONF_EXPAND_SECTIONS] = False
+
+    hass.config_entries.async_update_entry(entry, data={}, options=options, version=CONFIG_ENTRY_VERSION)
+    if _LOGGER.isEnabledFor(logging.INFO):
+        _LOGGER.info(
+            "[%s] Migration to v%s complete. %d valid keys preserved, %d keys discarded.",
+            entry.title, CONFIG_ENTRY_VERSION, len(options), len(discarded_keys),
+        )
 
     return True
 
@@ -266,19 +312,34 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
     # Get setup platforms
-    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
-    platforms = list(entry_data.get(SETUP_PLATFORMS, {Platform.CLIMATE}))
+    domain_data = hass.data.get(DOMAIN)
+    entry_data = domain_data.get(entry.entry_id, {}) if domain_data else {}
+    platforms = entry_data.get(SETUP_PLATFORMS) or _DEFAULT_PLATFORMS
 
     # Unload platforms
     unloaded = await hass.config_entries.async_unload_platforms(entry, platforms)
 
     # Clean up domain data
-    if unloaded and entry.entry_id in hass.data.get(DOMAIN, {}):
-        hass.data[DOMAIN].pop(entry.entry_id)
+    if unloaded and domain_data:
+        domain_data.pop(entry.entry_id, None)
 
     return unloaded
 
 
+def get_entry_group(hass: HomeAssistant, entry: ConfigEntry) -> ClimateGroupHelper | None:
+    """Return the group entity stored by the climate platform for this entry, if any."""
+    if (domain_data := hass.data.get(DOMAIN)) is None:
+        return None
+    if (entry_data := domain_data.get(entry.entry_id)) is None:
+        return None
+    return entry_data.get("group")
+
+
 async def _update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle options update by reloading the entry."""
+    """Handle options update by scheduling a reload of the entry.
+
+    async_schedule_reload only schedules the reload and never awaits it, so this
+    listener completes without suspending. The coroutine signature is kept because
+    add_update_listener requires it.
+    """
     hass.config_entries.async_schedule_reload(entry.entry_id)
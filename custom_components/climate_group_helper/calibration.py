@@ -43,8 +43,10 @@ class CalibrationHandler:
         self._group = group
         self._hass = group.hass
         self._climate_entity_ids = group.climate_entity_ids
-        self._temp_sensor_entity_ids = group.temp_sensor_entity_ids
-        self._humidity_sensor_entity_ids = group.humidity_sensor_entity_ids
+        # Sensor lists are only used for membership tests; built in async_setup once
+        # the group has filtered out its own CGH sensors.
+        self._temp_sensor_entity_ids: frozenset[str] = frozenset()
+        self._humidity_sensor_entity_ids: frozenset[str] = frozenset()
         self._get_valid_member_states = group._get_valid_member_states
 
         # Configuration
@@ -60,9 +62,14 @@ class CalibrationHandler:
         self._debouncer: Debouncer[Any] | None = None
         # Built in async_setup via device registry: target_entity_id → climate_member_id
         self._target_member_map: dict[str, str] = {}
+        # Reverse index of _target_member_map: climate_member_id → [target_entity_id, ...]
+        self._member_targets_map: dict[str, list[str]] = {}
 
     async def async_setup(self) -> None:
         """Build target→member mapping, start heartbeat timer if configured."""
+        self._temp_sensor_entity_ids = frozenset(self._group.temp_sensor_entity_ids)
+        self._humidity_sensor_entity_ids = frozenset(self._group.humidity_sensor_entity_ids)
+
         registry = er.async_get(self._hass)
         for target_id in self._temp_update_target_entity_ids:
             if (entry := registry.async_get(target_id)) and entry.device_id:
@@ -75,6 +82,9 @@ class CalibrationHandler:
                         )
                         break
 
+        for target_id, climate_id in self._target_member_map.items():
+            self._member_targets_map.setdefault(climate_id, []).append(target_id)
+
         if (
             self._calibration_heartbeat > 0
             and self._temp_update_target_entity_ids
@@ -135,12 +145,9 @@ class CalibrationHandler:
                 if mode == CalibrationMode.OFFSET:
                     # Sensor trigger → all targets; member trigger → only its mapped target
                     if event_entity_id not in self._temp_sensor_entity_ids:
-                        if event_entity_id not in self._target_member_map.values():
+                        if (member_targets := self._member_targets_map.get(event_entity_id)) is None:
                             return
-                        entity_ids = [
-                            target for target, member in self._target_member_map.items()
-                            if member == event_entity_id
-                        ]
+                        entity_ids = member_targets
                 elif event_entity_id not in self._temp_sensor_entity_ids:
                     return
             elif event_entity_id not in self._humidity_sensor_entity_ids:
@@ -148,54 +155,63 @@ class CalibrationHandler:
 
         valid_states, _ = self._get_valid_member_states(entity_ids)
 
+        # Loop invariants
+        get_state = self._hass.states.get
+        isolated = self._group.run_state.isolated_members
+        is_offset = domain == "temperature" and mode == CalibrationMode.OFFSET
+        is_scaled = domain == "temperature" and mode == CalibrationMode.SCALED
+        hvac_off = HVACMode.OFF.value
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+
         for target_state in valid_states:
             # Resolve the climate member paired with this calibration target (may be None)
             member_id = self._target_member_map.get(target_state.entity_id)
-            member_state = self._hass.states.get(member_id) if member_id else None
+            member_state = get_state(member_id) if member_id else None
 
             # Skip guards
-            if member_id and member_id in self._group.run_state.isolated_members:
-                _LOGGER.debug(
-                    "[%s] Skipping calibration update for %s because member %s is isolated",
-                    self._group.entity_id, target_state.entity_id, member_id,
-                )
+            if member_id and member_id in isolated:
+                if debug:
+                    _LOGGER.debug(
+                        "[%s] Skipping calibration update for %s because member %s is isolated",
+                        self._group.entity_id, target_state.entity_id, member_id,
+                    )
                 continue
 
             if member_state and member_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                _LOGGER.debug(
-                    "[%s] Skipping calibration update for %s because member %s is unavailable",
-                    self._group.entity_id, target_state.entity_id, member_id,
-                )
+                if debug:
+                    _LOGGER.debug(
+                        "[%s] Skipping calibration update for %s because member %s is unavailable",
+                        self._group.entity_id, target_state.entity_id, member_id,
+                    )
                 continue
 
-            if self._ignore_off and member_state and member_state.state == HVACMode.OFF:
-                _LOGGER.debug(
-                    "[%s] Skipping calibration update for %s because member %s is OFF (Battery Saver)",
-                    self._group.entity_id, target_state.entity_id, member_id,
-                )
+            if self._ignore_off and member_state and member_state.state == hvac_off:
+                if debug:
+                    _LOGGER.debug(
+                        "[%s] Skipping calibration update for %s because member %s is OFF (Battery Saver)",
+                        self._group.entity_id, target_state.entity_id, member_id,
+                    )
                 continue
 
             try:
                 # Compute target value
-                target_val = value
-                if domain == "temperature":
-                    if mode == CalibrationMode.OFFSET:
-                        # Prefer the mapped member's own temperature; fall back to group average
-                        ref_temp = self._group._member_temp_avg
-                        if member_state and (member_temp := member_state.attributes.get(ATTR_CURRENT_TEMPERATURE)) is not None:
-                            ref_temp = float(member_temp)
-                        if ref_temp is None:
-                            continue
-                        try:
-                            curr_offset = float(target_state.state)
-                        except (ValueError, TypeError):
-                            curr_offset = 0.0
-                        target_val = value - (ref_temp - curr_offset)
-                    elif mode == CalibrationMode.SCALED:
-                        target_val = int(round(value * 100))
-
-                if isinstance(target_val, float):
-                    target_val = round(target_val, 1)
+                if is_offset:
+                    # Prefer the mapped member's own temperature; fall back to group average
+                    ref_temp = self._group._member_temp_avg
+                    if member_state and (member_temp := member_state.attributes.get(ATTR_CURRENT_TEMPERATURE)) is not None:
+                        ref_temp = float(member_temp)
+                    if ref_temp is None:
+                        continue
+                    try:
+                        curr_offset = float(target_state.state)
+                    except (ValueError, TypeError):
+                        curr_offset = 0.0
+                    target_val = round(value - (ref_temp - curr_offset), 1)
+                elif is_scaled:
+                    # Single-argument round() already returns an int
+                    target_val = round(value * 100)
+                else:
+                    target_val = round(value, 1)
 
                 # Clamp to entity min/max — prevents ServiceValidationError: out_of_range
                 try:
@@ -258,7 +274,17 @@ class CalibrationHandler:
         pending = list(self._pending.items())
         self._pending.clear()
 
-        for i, (entity_id, value) in enumerate(pending):
+        # Without stagger, targets that share a value are written with one service call
+        calls: list[tuple[str | list[str], float | int]]
+        if not stagger_delay and len(pending) > 1:
+            buckets: dict[float | int, list[str]] = {}
+            for target_id, target_val in pending:
+                buckets.setdefault(target_val, []).append(target_id)
+            calls = [(ids[0] if len(ids) == 1 else ids, value) for value, ids in buckets.items()]
+        else:
+            calls = list(pending)
+
+        for i, (entity_id, value) in enumerate(calls):
 
             # Stagger delay between calls (not before first, not after last)
             if i > 0 and stagger_delay:
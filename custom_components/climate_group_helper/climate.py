@@ -1,13 +1,16 @@
 """This platform allows several climate devices to be grouped into one climate device."""
 from __future__ import annotations
 
-from dataclasses import fields, replace
+from collections import Counter
+from dataclasses import replace
 from functools import reduce
+from itertools import chain
 import json
 import logging
+from operator import and_, or_
 import time
-from statistics import mean, median
-from typing import Any, Awaitable, Callable
+from statistics import fmean, median
+from typing import Any, Awaitable, Callable, Sequence
 import voluptuous as vol
 
 from homeassistant.components.climate import (
@@ -43,12 +46,6 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.components.group.entity import GroupEntity
-from homeassistant.components.group.util import (
-    find_state_attributes,
-    most_frequent_attribute,
-    reduce_attribute,
-    states_equal,
-)
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.const import (
@@ -57,11 +54,12 @@ from homeassistant.const import (
     ATTR_TEMPERATURE,
     CONF_ENTITIES,
     CONF_NAME,
+    EVENT_CORE_CONFIG_UPDATE,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
 from homeassistant.helpers import config_validation as cv
-from homeassistant.core import HomeAssistant, State, callback, Event
+from homeassistant.core import HomeAssistant, State, callback, Event, EventStateChangedData
 from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -117,7 +115,6 @@ from .const import (
     DEFAULT_GRACE_PERIOD,
     DOMAIN,
     ENTITY_SELECTOR_KEYS,
-    FLOAT_TOLERANCE,
     IDENTITY_KEYS,
     MEMBER_LIST_KEYS,
     SERVICE_APPLY_CONFIG,
@@ -155,8 +152,8 @@ from .service_call import (
     WindowControlCallHandler,
 )
 from .state import (
+    CLIMATE_STATE_FIELDS,
     ChangeState,
-    ClimateState,
     CurrentState,
     RunState,
     TargetState,
@@ -169,12 +166,12 @@ from .state import (
 from .sync_mode import SyncModeHandler
 from .window_control import WindowControlHandler
 from .meta_processor import SlotMetaProcessor
-from .status import build_extra_state_attributes
+from .status import build_extra_state_attributes, configured_features
 
 CALC_TYPES: dict[AverageOption, Callable[..., float]] = {
     AverageOption.MIN: min,
     AverageOption.MAX: max,
-    AverageOption.MEAN: mean,
+    AverageOption.MEAN: fmean,
     AverageOption.MEDIAN: median,
 }
 
@@ -198,9 +195,122 @@ DEFAULT_SUPPORTED_FEATURES = (
     ClimateEntityFeature.TURN_OFF | ClimateEntityFeature.TURN_ON
 )
 
+# Canonical HVAC mode order, materialized once
+_HVAC_MODE_ORDER: tuple[HVACMode, ...] = tuple(HVACMode)
+
+# Member states that carry no usable climate data
+_UNAVAILABLE_STATES = frozenset({STATE_UNAVAILABLE, STATE_UNKNOWN})
+
+# Plain "off" string for per-member comparisons (member states are str, not HVACMode)
+_HVAC_MODE_OFF: str = HVACMode.OFF.value
+
+# Optional mode blocks: (feature, modes attribute, mode attribute, group attributes to set)
+_MODE_FEATURES: tuple[tuple[ClimateEntityFeature, str, str, str, str], ...] = (
+    (ClimateEntityFeature.FAN_MODE, ATTR_FAN_MODES, ATTR_FAN_MODE, "_attr_fan_modes", "_attr_fan_mode"),
+    (ClimateEntityFeature.PRESET_MODE, ATTR_PRESET_MODES, ATTR_PRESET_MODE, "_attr_preset_modes", "_attr_preset_mode"),
+    (ClimateEntityFeature.SWING_MODE, ATTR_SWING_MODES, ATTR_SWING_MODE, "_attr_swing_modes", "_attr_swing_mode"),
+    (
+        ClimateEntityFeature.SWING_HORIZONTAL_MODE,
+        ATTR_SWING_HORIZONTAL_MODES,
+        ATTR_SWING_HORIZONTAL_MODE,
+        "_attr_swing_horizontal_modes",
+        "_attr_swing_horizontal_mode",
+    ),
+)
+
+# Member attributes gathered in a single pass per update (see _scan_member_attributes)
+_SCANNED_ATTRIBUTES: tuple[str, ...] = (
+    ATTR_HVAC_MODES,
+    ATTR_HVAC_ACTION,
+    ATTR_FAN_MODES,
+    ATTR_PRESET_MODES,
+    ATTR_SWING_MODES,
+    ATTR_SWING_HORIZONTAL_MODES,
+    ATTR_SUPPORTED_FEATURES,
+    ATTR_FAN_MODE,
+    ATTR_PRESET_MODE,
+    ATTR_SWING_MODE,
+    ATTR_SWING_HORIZONTAL_MODE,
+    ATTR_TARGET_TEMP_STEP,
+    ATTR_MIN_TEMP,
+    ATTR_MAX_TEMP,
+    ATTR_MIN_HUMIDITY,
+    ATTR_MAX_HUMIDITY,
+    ATTR_TARGET_HUMIDITY_STEP,
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_TEMPERATURE,
+    ATTR_TARGET_TEMP_LOW,
+    ATTR_TARGET_TEMP_HIGH,
+    ATTR_CURRENT_HUMIDITY,
+    ATTR_HUMIDITY,
+)
+
+# Averaged temperature attributes, rescanned over the non-OFF subset when OFF members are ignored
+_TEMPERATURE_ATTRIBUTES: tuple[str, ...] = (
+    ATTR_CURRENT_TEMPERATURE,
+    ATTR_TEMPERATURE,
+    ATTR_TARGET_TEMP_LOW,
+    ATTR_TARGET_TEMP_HIGH,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
+def _round_half(value: float) -> float:
+    """Round to the nearest 0.5."""
+    return round(value * 2) / 2
+
+
+# RoundOption → rounding function; None keeps the value unchanged
+_ROUNDERS: dict[str, Callable[[float], float] | None] = {
+    RoundOption.NONE: None,
+    RoundOption.HALF: _round_half,
+    RoundOption.INTEGER: round,
+}
+
+
+def _scan_member_attributes(
+    states: list[State], keys: tuple[str, ...] = _SCANNED_ATTRIBUTES
+) -> dict[str, list[Any]]:
+    """Collect the non-None values of the given attributes in one pass.
+
+    Equivalent to one find_state_attributes() call per key, but each member's
+    attribute dict is walked once per update instead of once per attribute.
+    """
+    collected: dict[str, list[Any]] = {key: [] for key in keys}
+    items = collected.items()
+    for state in states:
+        get = state.attributes.get
+        for key, values in items:
+            if (value := get(key)) is not None:
+                values.append(value)
+    return collected
+
+
+def _reduce_limit(values: list[Any], reduce: Callable[[list[Any]], Any], default: Any = None) -> Any:
+    """Reduce pre-collected limit values (min/max/step), falling back to default when none were reported."""
+    return reduce(values) if values else default
+
+
+def _most_frequent(values: list[Any]) -> Any:
+    """Return the most common value, like most_frequent_attribute() on pre-collected values."""
+    if not values:
+        return None
+    return Counter(values).most_common(1)[0][0]
+
+
+def _reduce_average(values: list[Any], avg_calc: Callable[[list[Any]], Any]) -> Any:
+    """Average pre-collected values, mirroring HA's reduce_attribute() without the lambda adapter.
+
+    Like reduce_attribute(), a single value is returned as-is and no values yield None.
+    """
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return avg_calc(values)
+
+
 def _warn_missing_entities(hass: HomeAssistant, config: dict[str, Any], group_entity_id: str) -> None:
     """Log a warning for each configured entity that no longer exists in the state machine."""
     registry = er.async_get(hass)
@@ -257,9 +367,8 @@ async def async_setup_entry(
         config=config,
     )
 
-    # Store reference for other platforms (switch, etc.) to access the group entity
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(config_entry.entry_id, {})
+    # Store reference for other platforms (switch, etc.) to access the group entity.
+    # The entry's domain data is initialized in __init__.async_setup_entry.
     hass.data[DOMAIN][config_entry.entry_id]["group"] = group
 
     async_add_entities([group])
@@ -282,7 +391,10 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         self.hass = hass
         self.entry: ConfigEntry | None = None
         self.config = config
-        self.climate_entity_ids = entity_ids
+        # Members are fixed for the entity's lifetime (a reload rebuilds the group)
+        self.climate_entity_ids: tuple[str, ...] = tuple(entity_ids)
+        # Set view of the members for per-event membership tests; the tuple keeps config order
+        self._climate_entity_id_set: frozenset[str] = frozenset(entity_ids)
         self.event: Event | None = None
         self._attr_name = name
         self._attr_unique_id = unique_id
@@ -302,14 +414,15 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         # Temperature calculation options
         self._temp_current_avg_calc = CALC_TYPES[config.get(CONF_TEMP_CURRENT_AVG, AverageOption.MEAN)]
         self._temp_target_avg_calc = CALC_TYPES[config.get(CONF_TEMP_TARGET_AVG, AverageOption.MEAN)]
-        self._temp_round = config.get(CONF_TEMP_TARGET_ROUND, RoundOption.NONE)
+        self._temp_rounder = _ROUNDERS.get(config.get(CONF_TEMP_TARGET_ROUND, RoundOption.NONE))
         # Humidity calculation options
         self._humidity_current_avg_calc = CALC_TYPES[config.get(CONF_HUMIDITY_CURRENT_AVG, AverageOption.MEAN)]
         self._humidity_target_avg_calc = CALC_TYPES[config.get(CONF_HUMIDITY_TARGET_AVG, AverageOption.MEAN)]
-        self._humidity_round = config.get(CONF_HUMIDITY_TARGET_ROUND, RoundOption.NONE)
+        self._humidity_rounder = _ROUNDERS.get(config.get(CONF_HUMIDITY_TARGET_ROUND, RoundOption.NONE))
         # HVAC mode strategy
         self._hvac_mode_strategy = config.get(CONF_HVAC_MODE_STRATEGY, HvacModeStrategy.NORMAL)
         self._feature_strategy = config.get(CONF_FEATURE_STRATEGY, FeatureStrategy.INTERSECTION)
+        self._feature_union: bool = self._feature_strategy == FeatureStrategy.UNION
         self.debounce_delay = config.get(CONF_DEBOUNCE_DELAY, 0)
         self.retry_attempts = int(config.get(CONF_RETRY_ATTEMPTS, 0))
         self.retry_delay = config.get(CONF_RETRY_DELAY, 1)
@@ -325,6 +438,10 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         self._member_offset_correction: bool = config.get(CONF_MEMBER_OFFSET_CORRECTION, True)
         self._ignore_off_members_temperature: bool = config.get(CONF_IGNORE_OFF_MEMBERS_TEMPERATURE, False)
         self._member_temp_avg = None
+        # Features enabled by config alone (for the enabled_features attribute)
+        self.configured_features = configured_features(config)
+        # Reused across state writes; HA copies it into the State, so refilling is safe
+        self._extra_state_attributes: dict[str, Any] = {}
 
         # Range Template (Member Template Pattern)
         deadband_action = None
@@ -387,6 +504,11 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         self._attr_assumed_state = True
 
         self._current_hvac_modes: list[str] = []
+        self._member_attributes: dict[str, list[Any]] = {}
+        # attribute → (per-member inputs, reduced and sorted modes) from the last update
+        self._modes_cache: dict[str, tuple[list[Any], list[Any]]] = {}
+        # OR of all members' supported_features; gates the optional mode and humidity blocks
+        self._member_features: int = 0
 
         self._attr_current_temperature = None
         self._attr_target_temperature = None
@@ -437,7 +559,9 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        return build_extra_state_attributes(self)
+        attrs = self._extra_state_attributes
+        build_extra_state_attributes(self, attrs)
+        return attrs
 
     async def async_added_to_hass(self) -> None:
         """Restore states before registering listeners."""
@@ -463,11 +587,12 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         self.humidity_sensor_entity_ids = filter_cgh_sensors(
             self.hass, self.humidity_sensor_entity_ids, "humidity", self.entity_id
         )
-        self._entity_ids = (
-            self.climate_entity_ids
-            + self.temp_sensor_entity_ids
-            + self.humidity_sensor_entity_ids
-        )
+        # Deduplicate (order-preserving) so an entity listed twice is only tracked once
+        self._entity_ids = list(dict.fromkeys(chain(
+            self.climate_entity_ids,
+            self.temp_sensor_entity_ids,
+            self.humidity_sensor_entity_ids,
+        )))
 
         _warn_missing_entities(self.hass, self.config, self.entity_id)
 
@@ -482,9 +607,13 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         # Register listeners
         self.async_on_remove(
             async_track_state_change_event(
-                self.hass, self._entity_ids, self._state_change_listener  # type: ignore[arg-type]
+                self.hass, self._entity_ids, self._state_change_listener
             )
         )
+        # Temperature unit is read once in __init__ and refreshed only when the unit system changes
+        self.async_on_remove(
+            self.hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._core_config_updated)
+        )
 
         if self.advanced_mode:
             # Setup calibration handler (builds target→member mapping, starts heartbeat)
@@ -647,8 +776,7 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         # We filter for ClimateState fields to ensure we only store relevant climate attributes
         restored_data = {}
         valid_hvac_modes = {m.value for m in HVACMode}
-        for field in fields(ClimateState):
-            key = field.name
+        for key in CLIMATE_STATE_FIELDS:
             if key == "hvac_mode":
                 if last_state.state in valid_hvac_modes:
                     restored_data[key] = last_state.state
@@ -711,13 +839,15 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         if not attributes:
             return default if default is not None else []
 
+        union = self._feature_union
+
         # Handle list of features [ClimateEntityFeature | int]
         if isinstance(attributes[0], (ClimateEntityFeature, int)):
-            # Intersection (common features)
-            if self._feature_strategy == FeatureStrategy.INTERSECTION:
-                return reduce(lambda x, y: x & y, attributes)  # type: ignore[no-any-return]
             # Union (all features)
-            return reduce(lambda x, y: x | y, attributes)  # type: ignore[no-any-return]
+            if union:
+                return reduce(or_, attributes)  # type: ignore[no-any-return]
+            # Intersection (common features)
+            return reduce(and_, attributes)  # type: ignore[no-any-return]
 
         # Handle list of modes [HVACMode | str]
         # Filter out empty attributes or None
@@ -725,15 +855,34 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         if not valid_attributes:
             return []
 
-        # Intersection (common modes)
-        if self._feature_strategy == FeatureStrategy.INTERSECTION:
-            modes = list(reduce(lambda x, y: set(x) & set(y), valid_attributes))
+        # A single member's list is both the union and the intersection
+        if len(valid_attributes) == 1:
+            modes = list(dict.fromkeys(valid_attributes[0]))
         # Union (all modes)
+        elif union:
+            modes = list(set().union(*valid_attributes))
+        # Intersection (common modes)
         else:
-            modes = list(reduce(lambda x, y: set(x) | set(y), valid_attributes))
+            modes = list(set(valid_attributes[0]).intersection(*valid_attributes[1:]))
 
         return modes
 
+    def _reduce_sorted_modes(self, attr: str, sort: Callable[[list[Any]], list[Any]]) -> list[Any]:
+        """Return the reduced and sorted modes for attr, reusing the last result.
+
+        Member mode lists almost never change, so the union/intersection and sort
+        only rerun when the collected per-member lists differ from the last update.
+        """
+        inputs = self._member_attributes[attr]
+        cached = self._modes_cache.get(attr)
+        if cached is not None and cached[0] == inputs:
+            return cached[1]
+
+        modes = self._reduce_attributes(inputs)
+        result = sort(modes) if isinstance(modes, list) else []
+        self._modes_cache[attr] = (inputs, result)
+        return result
+
     def _start_grace_period_timer(self, remaining: float) -> None:
         """(Re-)start the one-shot timer that forces a state refresh when the grace period expires.
 
@@ -770,14 +919,16 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         if self._grace_period <= 0:
             return None
 
-        timestamp = self.shared_target_state.last_timestamp or 0
-        elapsed = time.time() - timestamp
-
-        if self.shared_target_state.last_source == "ui" and elapsed < self._grace_period:
-            if timestamp != self._grace_period_last_ts:
-                self._grace_period_last_ts = timestamp
-                self._start_grace_period_timer(self._grace_period - elapsed)
-            return getattr(self.shared_target_state, attr, None)
+        # Only UI commands open a grace period — skip the clock read otherwise
+        target_state = self.shared_target_state
+        if target_state.last_source == "ui":
+            timestamp = target_state.last_timestamp or 0
+            remaining = timestamp + self._grace_period - time.time()
+            if remaining > 0:
+                if timestamp != self._grace_period_last_ts:
+                    self._grace_period_last_ts = timestamp
+                    self._start_grace_period_timer(remaining)
+                return getattr(target_state, attr, None)
 
         self._cancel_grace_period_timer()
         return None
@@ -785,11 +936,12 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
     def _sort_hvac_modes(self, modes: list[Any]) -> list[HVACMode]:
         """Sort HVAC modes based on a predefined order."""
 
-        # Make sure OFF is always included
-        all_modes = set(modes) | {HVACMode.OFF}
+        # Make sure OFF is always included (copy, the caller's list is never mutated)
+        all_modes = set(modes)
+        all_modes.add(HVACMode.OFF)
 
         # Return modes sorted in the order of the HVACMode enum
-        return [m for m in HVACMode if m in all_modes]
+        return [m for m in _HVAC_MODE_ORDER if m in all_modes]
 
     def _determine_hvac_mode(self, current_hvac_modes: list[str]) -> HVACMode | None:
         """Determine the group's HVAC mode based on member modes and strategy."""
@@ -797,11 +949,12 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         if (val := self._get_optimistic_value("hvac_mode")) is not None:
             return HVACMode(val)
 
-        active_hvac_modes = [mode for mode in current_hvac_modes if mode != HVACMode.OFF]
+        active_hvac_modes = [mode for mode in current_hvac_modes if mode != _HVAC_MODE_OFF]
+        any_off = len(active_hvac_modes) != len(current_hvac_modes)
 
         most_common_active_hvac_mode: HVACMode | None = None
         if active_hvac_modes:
-            most_common_active_hvac_mode = HVACMode(max(active_hvac_modes, key=active_hvac_modes.count))
+            most_common_active_hvac_mode = HVACMode(Counter(active_hvac_modes).most_common(1)[0][0])
 
         strategy = self._hvac_mode_strategy
 
@@ -817,7 +970,7 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         # Normal strategy
         if strategy == HvacModeStrategy.NORMAL:
             # If all members are OFF, the group is OFF
-            if all(mode == HVACMode.OFF for mode in current_hvac_modes) if current_hvac_modes else False:
+            if current_hvac_modes and not active_hvac_modes:
                 return HVACMode.OFF
             # Otherwise, return the most common active HVAC mode
             return most_common_active_hvac_mode
@@ -825,7 +978,7 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         # Off priority strategy
         if strategy == HvacModeStrategy.OFF_PRIORITY:
             # If any member is OFF, the group is OFF
-            if HVACMode.OFF in current_hvac_modes:
+            if any_off:
                 return HVACMode.OFF
             # Otherwise, return the most common active HVAC mode
             return most_common_active_hvac_mode
@@ -836,45 +989,25 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
     def _determine_hvac_action(self, current_hvac_actions: list[HVACAction | None]) -> HVACAction | None:
         """Determine the group's HVAC action based on member actions and a priority."""
 
+        # Tally once; inactive actions are split off so only active ones remain
+        counts = Counter(current_hvac_actions)
+        idle_count = counts.pop(HVACAction.IDLE, 0)
+        off_count = counts.pop(HVACAction.OFF, 0)
+        counts.pop(None, None)
+
         # 1. Priority: Active states (heating, cooling, etc.)
-        active_hvac_actions = [
-            action
-            for action in current_hvac_actions
-            if action not in (HVACAction.OFF, HVACAction.IDLE, None)
-        ]
-        if active_hvac_actions:
+        if counts:
             # Set hvac_action to the most common active HVAC action
-            return max(active_hvac_actions, key=active_hvac_actions.count)
+            return counts.most_common(1)[0][0]
         # 2. Priority: Idle state
-        if HVACAction.IDLE in current_hvac_actions:
+        if idle_count:
             return HVACAction.IDLE
         # 3. Priority: Off state
-        if HVACAction.OFF in current_hvac_actions:
+        if off_count:
             return HVACAction.OFF
         # 4. Fallback
         return None
 
-    @staticmethod
-    def within_tolerance(val1: Any, val2: Any, tolerance: float = FLOAT_TOLERANCE) -> bool:
-        """Check if two values are within a given tolerance."""
-        try:
-            return abs(float(val1) - float(val2)) < tolerance
-        except (ValueError, TypeError):
-            return False
-
-    @staticmethod
-    def mean_round(value: float | None, round_option: RoundOption = RoundOption.NONE) -> float | None:
-        """Round the decimal part of a float to an fractional value with a certain precision."""
-
-        if value is None:
-            return None
-
-        if round_option == RoundOption.HALF:
-            return round(value * 2) / 2
-        if round_option == RoundOption.INTEGER:
-            return round(value)
-        return value
-
     def read_member_state(self, entity_id: str) -> State | None:
         """Central member-state read — the only path that applies Member Templates.
 
@@ -907,7 +1040,7 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         old_wrapped = manager.apply_state(entity_id, old_state) if old_state else None
         return new_wrapped, old_wrapped
 
-    def _get_valid_member_states(self, entity_ids: list[str]) -> tuple[list[State], bool]:
+    def _get_valid_member_states(self, entity_ids: Sequence[str]) -> tuple[list[State], bool]:
         """Get valid states for provided entities.
 
         Excludes isolated members (e.g. curtain closed) from all calculations.
@@ -916,16 +1049,19 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
             all entity_ids have a valid (not unavailable/unknown) state.
         """
         excluded = self.run_state.isolated_members
-        expected_entity_ids = [entity_id for entity_id in entity_ids if entity_id not in excluded]
+        read_state = self.read_member_state
+        valid_states: list[State] = []
+        expected = 0
 
-        all_states = [
-            state
-            for entity_id in expected_entity_ids
-            if (state := self.read_member_state(entity_id)) is not None
-        ]
-        valid_states = [state for state in all_states if state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)]
-        all_ready = len(valid_states) == len(expected_entity_ids) if expected_entity_ids else True
-        return valid_states, all_ready
+        for entity_id in entity_ids:
+            if entity_id in excluded:
+                continue
+            expected += 1
+            state = read_state(entity_id)
+            if state is not None and state.state not in _UNAVAILABLE_STATES:
+                valid_states.append(state)
+
+        return valid_states, len(valid_states) == expected
 
     def _get_avg_sensor_value(self, sensor_ids: list[str], calc_func: Callable[[list[float]], float]) -> float | None:
         """Calculate average value from multiple sensors."""
@@ -933,19 +1069,27 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
             return None
 
         valid_states, _ = self._get_valid_member_states(sensor_ids)
-        values = []
+        if not valid_states:
+            return None
+
+        values: list[float] = []
+        append = values.append
         for state in valid_states:
             try:
-                values.append(float(state.state))
+                append(float(state.state))
             except (ValueError, TypeError):
                 pass
 
-        if values:
-            return calc_func(values)
-        return None
+        return calc_func(values) if values else None
 
     @callback
-    def _state_change_listener(self, event: Event | None = None) -> None:
+    def _core_config_updated(self, _event: Event) -> None:
+        """Refresh the temperature unit after the core configuration changed."""
+        self._attr_temperature_unit = self.hass.config.units.temperature_unit
+        self.async_defer_or_update_ha_state()
+
+    @callback
+    def _state_change_listener(self, event: Event[EventStateChangedData] | None = None) -> None:
         """Handle a member `state_changed` event.
 
         For active Member Templates (e.g. Range Template), the event is
@@ -1033,16 +1177,16 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
             self._event_entity_id = self.event.data.get(ATTR_ENTITY_ID)
 
             # Check if the change state is from a member entity
-            if self.change_state and self.change_state.entity_id in self.climate_entity_ids:
+            if self.change_state and self.change_state.entity_id in self._climate_entity_id_set:
                 self.sync_mode_handler.resync()
 
         # All available HVAC modes --> list of HVACMode (str), e.g. [<HVACMode.OFF: 'off'>, <HVACMode.HEAT: 'heat'>, <HVACMode.AUTO: 'auto'>, ...]
-        hvac_modes = self._reduce_attributes(list(find_state_attributes(self.states, ATTR_HVAC_MODES)))
-        hvac_modes_list = hvac_modes if isinstance(hvac_modes, list) else []
+        member_attributes = self._member_attributes = _scan_member_attributes(self.states)
+        hvac_modes_list = self._reduce_sorted_modes(ATTR_HVAC_MODES, self._sort_hvac_modes)
         template_member_ids = self.member_template_manager.update_members()
         if template_member_ids and HVACMode.HEAT_COOL not in hvac_modes_list:
-            hvac_modes_list = list(hvac_modes_list) + [HVACMode.HEAT_COOL]
-        self._attr_hvac_modes = self._sort_hvac_modes(hvac_modes_list)
+            hvac_modes_list = self._sort_hvac_modes(hvac_modes_list + [HVACMode.HEAT_COOL])
+        self._attr_hvac_modes = hvac_modes_list
 
         # A list of all HVAC modes that are currently set
         self._current_hvac_modes = [state.state for state in self.states]
@@ -1057,19 +1201,17 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         # The group is available if any member is available
         self._attr_available = True
 
-        # The group state is assumed if not all states are equal
-        self._attr_assumed_state = not states_equal(self.states)
+        # The group state is assumed if not all states are equal (reuses the mode list above)
+        current_hvac_modes = self._current_hvac_modes
+        self._attr_assumed_state = current_hvac_modes.count(current_hvac_modes[0]) != len(current_hvac_modes)
 
         # Determine HVAC action
-        current_hvac_actions = list(find_state_attributes(self.states, ATTR_HVAC_ACTION))
-        self._attr_hvac_action = self._determine_hvac_action(current_hvac_actions)
-
-        # Get temperature unit from system settings
-        self._attr_temperature_unit = self.hass.config.units.temperature_unit
+        self._attr_hvac_action = self._determine_hvac_action(member_attributes[ATTR_HVAC_ACTION])
 
+        # Runs first so the humidity update can check the fresh supported_features
+        self._update_mode_attributes()
         self._update_temperature_attributes()
         self._update_humidity_attributes()
-        self._update_mode_attributes()
 
         # Populate current_group_state
         self.current_group_state = CurrentState(
@@ -1097,13 +1239,22 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         self.event = None
         self._event_entity_id = None
 
-    def _resolve_master_or_avg(self, use_master: bool, master_value: float | None, attr: str, avg_calc: Callable[[Any], float | None], states: list[State]) -> float | None:
+    def _resolve_master_or_avg(
+        self,
+        use_master: bool,
+        master_value: float | None,
+        attr: str,
+        avg_calc: Callable[[Any], float | None],
+        states: list[State],
+        collected: dict[str, list[Any]],
+    ) -> float | None:
         """Return the display value for a temperature or humidity attribute.
 
         Priority: master entity → offset-corrected average → raw member average.
         `states` is provided by the caller — either the full self.states or a pre-filtered
-        subset (e.g. without OFF members). Offset correction subtracts each member's
-        per-device offset before averaging so the group shows the logical set point.
+        subset (e.g. without OFF members) — and `collected` holds its scanned attribute
+        values. Offset correction subtracts each member's per-device offset before
+        averaging so the group shows the logical set point.
         """
         if use_master and self._master_entity_id and master_value is not None:
             return master_value
@@ -1113,14 +1264,35 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
             and self._member_offset_correction
             and attr in (ATTR_TEMPERATURE, ATTR_TARGET_TEMP_LOW, ATTR_TARGET_TEMP_HIGH)
         ):
+            offset_get = self._temp_offset_map.get
             values = [
-                val - self._temp_offset_map.get(s.entity_id, 0.0)
+                val - offset_get(s.entity_id, 0.0)
                 for s in states
                 if (val := s.attributes.get(attr)) is not None
             ]
             return avg_calc(values) if values else None
 
-        return reduce_attribute(states, attr, reduce=lambda *data: avg_calc(data))  # type: ignore[no-any-return]
+        return _reduce_average(collected[attr], avg_calc)  # type: ignore[no-any-return]
+
+    def _resolve_target_temperature(
+        self,
+        attr: str,
+        master_value: float | None,
+        states: list[State],
+        collected: dict[str, list[Any]],
+    ) -> float | None:
+        """Return one rounded target temperature (temperature, target_temp_low or target_temp_high).
+
+        `attr` doubles as the TargetState field name for the grace-period lookup.
+        """
+        val = self._get_optimistic_value(attr)
+        if val is None:
+            val = self._resolve_master_or_avg(
+                self._temp_use_master, master_value, attr, self._temp_target_avg_calc, states, collected
+            )
+        if val is not None and (rounder := self._temp_rounder) is not None:
+            val = rounder(val)
+        return val
 
     def _update_temperature_attributes(self) -> None:
         """Calculate and set all temperature-related attributes.
@@ -1129,16 +1301,15 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
         min_temp, max_temp, and temp_step always use self.states — device capability limits
         must reflect the full group regardless of which members are currently active.
         """
-        temp_states = (
-            [s for s in self.states if s.state != HVACMode.OFF]
-            if self._ignore_off_members_temperature
-            else self.states
-        )
+        if self._ignore_off_members_temperature:
+            temp_states = [s for s in self.states if s.state != _HVAC_MODE_OFF]
+            temp_attributes = _scan_member_attributes(temp_states, _TEMPERATURE_ATTRIBUTES)
+        else:
+            temp_states = self.states
+            temp_attributes = self._member_attributes
 
         # Current temperature
-        self._member_temp_avg = reduce_attribute(
-            temp_states, ATTR_CURRENT_TEMPERATURE, reduce=lambda *data: self._temp_current_avg_calc(data)
-        )
+        self._member_temp_avg = _reduce_average(temp_attributes[ATTR_CURRENT_TEMPERATURE], self._temp_current_avg_calc)
         if self.temp_sensor_entity_ids:  # always empty in simple mode
             self._attr_current_temperature = self._get_avg_sensor_value(self.temp_sensor_entity_ids, self._temp_current_avg_calc)
             if self._attr_current_temperature is not None:
@@ -1150,38 +1321,36 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
 
         # Target temperatures: grace period → master override → offset-corrected member average
         master = self.current_master_state
-        val = self._get_optimistic_value("temperature")
-        self._attr_target_temperature = val if val is not None else self._resolve_master_or_avg(
-            self._temp_use_master, master.temperature, ATTR_TEMPERATURE, self._temp_target_avg_calc, temp_states
+        self._attr_target_temperature = self._resolve_target_temperature(
+            ATTR_TEMPERATURE, master.temperature, temp_states, temp_attributes
         )
-        val = self._get_optimistic_value("target_temp_low")
-        self._attr_target_temperature_low = val if val is not None else self._resolve_master_or_avg(
-            self._temp_use_master, master.target_temp_low, ATTR_TARGET_TEMP_LOW, self._temp_target_avg_calc, temp_states
+        self._attr_target_temperature_low = self._resolve_target_temperature(
+            ATTR_TARGET_TEMP_LOW, master.target_temp_low, temp_states, temp_attributes
         )
-        val = self._get_optimistic_value("target_temp_high")
-        self._attr_target_temperature_high = val if val is not None else self._resolve_master_or_avg(
-            self._temp_use_master, master.target_temp_high, ATTR_TARGET_TEMP_HIGH, self._temp_target_avg_calc, temp_states
+        self._attr_target_temperature_high = self._resolve_target_temperature(
+            ATTR_TARGET_TEMP_HIGH, master.target_temp_high, temp_states, temp_attributes
         )
 
-        # Round target values
-        for attr in ("_attr_target_temperature", "_attr_target_temperature_low", "_attr_target_temperature_high"):
-            val = getattr(self, attr)
-            if val is not None:
-                setattr(self, attr, self.mean_round(val, self._temp_round))
-
         # Temperature limits and step
-        self._attr_target_temperature_step = reduce_attribute(self.states, ATTR_TARGET_TEMP_STEP, reduce=max)
-        if self._feature_strategy == FeatureStrategy.UNION:
+        member_attributes = self._member_attributes
+        self._attr_target_temperature_step = _reduce_limit(member_attributes[ATTR_TARGET_TEMP_STEP], max)
+        if self._feature_union:
             # Union: widest range — lowest min, highest max
-            self._attr_min_temp = reduce_attribute(self.states, ATTR_MIN_TEMP, reduce=min, default=DEFAULT_MIN_TEMP)
-            self._attr_max_temp = reduce_attribute(self.states, ATTR_MAX_TEMP, reduce=max, default=DEFAULT_MAX_TEMP)
+            self._attr_min_temp = _reduce_limit(member_attributes[ATTR_MIN_TEMP], min, DEFAULT_MIN_TEMP)
+            self._attr_max_temp = _reduce_limit(member_attributes[ATTR_MAX_TEMP], max, DEFAULT_MAX_TEMP)
         else:
             # Intersection (default): narrowest range — highest min, lowest max
-            self._attr_min_temp = reduce_attribute(self.states, ATTR_MIN_TEMP, reduce=max, default=DEFAULT_MIN_TEMP)
-            self._attr_max_temp = reduce_attribute(self.states, ATTR_MAX_TEMP, reduce=min, default=DEFAULT_MAX_TEMP)
+            self._attr_min_temp = _reduce_limit(member_attributes[ATTR_MIN_TEMP], max, DEFAULT_MIN_TEMP)
+            self._attr_max_temp = _reduce_limit(member_attributes[ATTR_MAX_TEMP], min, DEFAULT_MAX_TEMP)
 
     def _update_humidity_attributes(self) -> None:
-        """Calculate and set all humidity-related attributes."""
+        """Calculate and set all humidity-related attributes.
+
+        Target humidity and its limits are gated together on _member_features (the OR
+        of all members' supported_features), like the optional mode blocks: a value is
+        computed whenever any member can report it, independent of the union/intersection
+        strategy that decides what the group exposes. Current humidity is always set.
+        """
         # Current humidity
         if self.humidity_sensor_entity_ids:  # always empty in simple mode
             self._attr_current_humidity = self._get_avg_sensor_value(
@@ -1192,53 +1361,55 @@ class ClimateGroupHelper(GroupEntity, ClimateEntity, RestoreEntity):
             else:
                 _LOGGER.debug("[%s] External humidity sensors unavailable.", self.entity_id)
         else:
-            self._attr_current_humidity = reduce_attribute(
-                self.states, ATTR_CURRENT_HUMIDITY, reduce=lambda *data: self._humidity_current_avg_calc(data)
+            self._attr_current_humidity = _reduce_average(
+                self._member_attributes[ATTR_CURRENT_HUMIDITY], self._humidity_current_avg_calc
             )
 
+        if not self._member_features & ClimateEntityFeature.TARGET_HUMIDITY:
+            self._attr_target_humidity = None
+            return
+
         # Target humidity: grace period → master override → member average
         val = self._get_optimistic_value("humidity")
         self._attr_target_humidity = val if val is not None else self._resolve_master_or_avg(
-            self._humidity_use_master, self.current_master_state.humidity, ATTR_HUMIDITY, self._humidity_target_avg_calc, self.states
+            self._humidity_use_master, self.current_master_state.humidity, ATTR_HUMIDITY, self._humidity_target_avg_calc, self.states, self._member_attributes
         )
-        if self._attr_target_humidity is not None:
-            self._attr_target_humidity = self.mean_round(self._attr_target_humidity, self._humidity_round)
+        if self._attr_target_humidity is not None and (rounder := self._humidity_rounder) is not None:
+            self._attr_target_humidity = rounder(self._attr_target_humidity)
 
         # Humidity limits and step
-        self._attr_min_humidity = reduce_attribute(self.states, ATTR_MIN_HUMIDITY, reduce=max, default=DEFAULT_MIN_HUMIDITY)
-        self._attr_max_humidity = reduce_attribute(self.states, ATTR_MAX_HUMIDITY, reduce=min, default=DEFAULT_MAX_HUMIDITY)
-        self._attr_target_humidity_step = reduce_attribute(self.states, ATTR_TARGET_HUMIDITY_STEP, reduce=max)
+        member_attributes = self._member_attributes
+        self._attr_min_humidity = _reduce_limit(member_attributes[ATTR_MIN_HUMIDITY], max, DEFAULT_MIN_HUMIDITY)
+        self._attr_max_humidity = _reduce_limit(member_attributes[ATTR_MAX_HUMIDITY], min, DEFAULT_MAX_HUMIDITY)
+        self._attr_target_humidity_step = _reduce_limit(member_attributes[ATTR_TARGET_HUMIDITY_STEP], max)
 
     def _update_mode_attributes(self) -> None:
-        """Calculate and set fan, preset, swing modes and supported features."""
-        fan_modes = self._reduce_attributes(list(find_state_attributes(self.states, ATTR_FAN_MODES)))
-        self._attr_fan_modes = sorted(fan_modes) if isinstance(fan_modes, list) else []
-        val = self._get_optimistic_value("fan_mode")
-        self._attr_fan_mode = val if val is not None else most_frequent_attribute(self.states, ATTR_FAN_MODE)
-
-        preset_modes = self._reduce_attributes(list(find_state_attributes(self.states, ATTR_PRESET_MODES)))
-        self._attr_preset_modes = sorted(preset_modes) if isinstance(preset_modes, list) else []
-        val = self._get_optimistic_value("preset_mode")
-        self._attr_preset_mode = val if val is not None else most_frequent_attribute(self.states, ATTR_PRESET_MODE)
-
-        swing_modes = self._reduce_attributes(list(find_state_attributes(self.states, ATTR_SWING_MODES)))
-        self._attr_swing_modes = sorted(swing_modes) if isinstance(swing_modes, list) else []
-        val = self._get_optimistic_value("swing_mode")
-        self._attr_swing_mode = val if val is not None else most_frequent_attribute(self.states, ATTR_SWING_MODE)
-
-        swing_horizontal_modes = self._reduce_attributes(list(find_state_attributes(self.states, ATTR_SWING_HORIZONTAL_MODES)))
-        self._attr_swing_horizontal_modes = sorted(swing_horizontal_modes) if isinstance(swing_horizontal_modes, list) else []
-        val = self._get_optimistic_value("swing_horizontal_mode")
-        self._attr_swing_horizontal_mode = val if val is not None else most_frequent_attribute(self.states, ATTR_SWING_HORIZONTAL_MODE)
+        """Calculate and set supported features, then fan, preset and swing modes."""
+        member_attributes = self._member_attributes
 
         # Supported features
-        attr_supported_features = self._reduce_attributes(list(find_state_attributes(self.states, ATTR_SUPPORTED_FEATURES)), default=0)
+        member_features = member_attributes[ATTR_SUPPORTED_FEATURES]
+        attr_supported_features = self._reduce_attributes(member_features, default=0)
         features = attr_supported_features if isinstance(attr_supported_features, int) else 0
         range_template = self.member_template_manager.range_template
         if range_template is not None and range_template.entity_ids:
             features |= ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
         self._attr_supported_features = (features | DEFAULT_SUPPORTED_FEATURES) & SUPPORTED_FEATURES
 
+        # Features advertised by at least one member, independent of the union/intersection
+        # strategy: a mode block nobody supports has nothing to reduce and stays None.
+        self._member_features = reduce(or_, member_features, 0)
+
+        for feature, modes_attr, mode_attr, modes_field, mode_field in _MODE_FEATURES:
+            if self._member_features & feature:
+                modes = self._reduce_sorted_modes(modes_attr, sorted)
+                val = self._get_optimistic_value(mode_attr)
+                mode = val if val is not None else _most_frequent(member_attributes[mode_attr])
+            else:
+                modes = mode = None
+            setattr(self, modes_field, modes)
+            setattr(self, mode_field, mode)
+
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Forward the set_hvac_mode command to all climate in the climate group."""
         self.climate_state_manager.update(hvac_mode=hvac_mode)
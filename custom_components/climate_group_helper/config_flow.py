@@ -101,6 +101,7 @@ from .const import (
     CONF_WINDOW_TEMPERATURE,
     CONF_ZONE_OPEN_DELAY,
     CONF_ZONE_SENSOR,
+    CONFIG_ENTRY_VERSION,
     DEFAULT_CLOSE_DELAY,
     DEFAULT_GRACE_PERIOD,
     DEFAULT_NAME,
@@ -131,7 +132,7 @@ from .climate import filter_cgh_sensors
 class ClimateGroupHelperConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Climate Group."""
 
-    VERSION = 11
+    VERSION = CONFIG_ENTRY_VERSION
 
     @staticmethod
     @callback
@@ -29,6 +29,9 @@ from homeassistant.const import ATTR_TEMPERATURE, CONF_ENTITIES, CONF_NAME
 DOMAIN = "climate_group_helper"
 DEFAULT_NAME = "Climate Group"
 
+# Config entry schema version (bump together with async_migrate_entry)
+CONFIG_ENTRY_VERSION = 11
+
 # Member & Modes
 CONF_ADVANCED_MODE = "advanced_mode"
 CONF_MASTER_ENTITY = "master_entity"
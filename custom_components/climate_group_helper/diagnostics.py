@@ -8,7 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
+from . import get_entry_group
 from .state import TargetState
 
 
@@ -32,8 +32,7 @@ async def async_get_config_entry_diagnostics(
     }
 
     # Try to get the group entity for runtime diagnostics
-    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
-    group = entry_data.get("group")
+    group = get_entry_group(hass, entry)
 
     if not group:
         diag["error"] = "Climate group entity not found in hass.data"
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, Callable
 
 from homeassistant.components.climate import HVACMode
 from homeassistant.const import STATE_ON, STATE_UNAVAILABLE, STATE_UNKNOWN
-from homeassistant.core import Event, EventStateChangedData, callback
+from homeassistant.core import Event, EventStateChangedData, State, callback
 from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 
 from .const import (
@@ -354,8 +354,8 @@ class IsolationCallHandler(BaseServiceCallHandler):
         """Never block — isolation handler bypasses all blocking."""
         return False
 
-    def _get_capable_entities(self, attr: str, value: Any = None) -> list[str]:
-        """Return only the single isolated entity (if capable)."""
+    def _get_capable_states(self, attr: str, value: Any = None) -> list[State]:
+        """Return only the single isolated entity's state (if capable)."""
         state = self._hass.states.get(self._entity_id)
         if not state or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
             return []
@@ -369,4 +369,4 @@ class IsolationCallHandler(BaseServiceCallHandler):
                 return []
         elif attr not in state.attributes:
             return []
-        return [self._entity_id]
+        return [state]
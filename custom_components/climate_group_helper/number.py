@@ -11,7 +11,8 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, META_KEY_GROUP_OFFSET
+from . import get_entry_group
+from .const import META_KEY_GROUP_OFFSET
 
 if TYPE_CHECKING:
     from .climate import ClimateGroupHelper
@@ -25,8 +26,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the group offset number for each climate group."""
-    entry_data = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
-    group = entry_data.get("group")
+    group = get_entry_group(hass, config_entry)
 
     if not group:
         _LOGGER.warning("[%s] Climate group entity not found for config entry, skipping number setup", config_entry.title)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import fields, replace
+from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.climate import HVACMode
@@ -20,7 +20,7 @@ from .const import (
     WindowControlAction,
 )
 from .schedule import ScheduleCaller
-from .state import ClimateState, TargetState
+from .state import CLIMATE_STATE_FIELDS, TargetState
 
 if TYPE_CHECKING:
     from .climate import ClimateGroupHelper
@@ -219,9 +219,9 @@ class BoostOverrideManager(BaseOverrideManager):
             await schedule.schedule_listener(caller=ScheduleCaller.RESYNC)
         elif snapshot:
             restore_kwargs = {
-                f.name: getattr(snapshot, f.name)
-                for f in fields(ClimateState)
-                if getattr(snapshot, f.name, None) is not None
+                key: value
+                for key in CLIMATE_STATE_FIELDS
+                if (value := getattr(snapshot, key, None)) is not None
             }
             schedule.state_manager.update(**restore_kwargs)
             await self.call_handler.call_immediate()
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 import yaml  # type: ignore[import-untyped]
-from dataclasses import fields, replace
+from dataclasses import replace
 from enum import StrEnum
 from typing import TYPE_CHECKING, Any, Callable
 
@@ -30,7 +30,7 @@ from .const import (
     CONF_PERSIST_CHANGES,
 )
 from .meta_processor import MetaProcessResult
-from .state import ClimateState
+from .state import CLIMATE_STATE_FIELDS
 
 _CLIMATE_MODE_ATTRS: frozenset[str] = frozenset(
     {
@@ -170,10 +170,10 @@ class ScheduleBaseHandler:
         does not leave the group in the wrong mode after restore.
         """
         result = {}
-        for f in fields(ClimateState):
-            value = getattr(snapshot, f.name, None)
-            if f.name == "hvac_mode" or value is not None:
-                result[f.name] = value
+        for key in CLIMATE_STATE_FIELDS:
+            value = getattr(snapshot, key, None)
+            if key == "hvac_mode" or value is not None:
+                result[key] = value
         return result
 
     def _validate_climate_payload(self, entity_id: str, payload: dict[str, Any]) -> dict[str, Any]:
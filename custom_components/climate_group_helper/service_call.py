@@ -39,7 +39,7 @@ from .const import (
     UnionOutOfBoundsAction,
     UnsupportedHvacAction,
 )
-from .state import FilterState
+from .state import FilterState, within_tolerance
 
 if TYPE_CHECKING:
     from .climate import ClimateGroupHelper
@@ -388,7 +388,11 @@ class BaseServiceCallHandler(ABC):
         return False
 
     def _get_capable_entities(self, attr: str, value: Any = None) -> list[str]:
-        """Get members that technically support this attribute/value (Capability check).
+        """Get the entity IDs of members that pass _get_capable_states."""
+        return [state.entity_id for state in self._get_capable_states(attr, value)]
+
+    def _get_capable_states(self, attr: str, value: Any = None) -> list[State]:
+        """Get states of members that technically support this attribute/value (Capability check).
 
         For mode attributes (hvac_mode, fan_mode, preset_mode, swing_mode):
             With value: checks if value is in the device's supported modes list.
@@ -402,7 +406,7 @@ class BaseServiceCallHandler(ABC):
             attr: The attribute to check capability for.
             value: Target value. Used for mode attributes only — ignored for float attributes.
         """
-        entity_ids = []
+        states: list[State] = []
         for entity_id in self._group.climate_entity_ids:
             if self._is_member_blocked(entity_id):
                 continue
@@ -425,14 +429,14 @@ class BaseServiceCallHandler(ABC):
                     continue
             elif attr not in state.attributes:
                 continue
-            entity_ids.append(entity_id)
-        return entity_ids
+            states.append(state)
+        return states
 
     def _get_filtered_entities(self, attr: str, value: Any = None) -> list[str]:
         """Get members that should receive a call for this attribute.
 
         Unified entity selection pipeline used by all handlers:
-        1. Capability check via _get_capable_entities (with target value for mode attrs).
+        1. Capability check via _get_capable_states (with target value for mode attrs).
         2. _block_unsynced_entity hook (e.g. skip OFF members for Partial Sync).
         3. Value diffing — skipped when _should_diff() returns False (ClimateCallHandler).
 
@@ -446,11 +450,9 @@ class BaseServiceCallHandler(ABC):
         if target_value is None:
             return []
 
-        for entity_id in self._get_capable_entities(attr, target_value):
-            state = self._group.read_member_state(entity_id)
-            if not state or state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
-                continue
-
+        # Capable states are already read and known to be available
+        for state in self._get_capable_states(attr, target_value):
+            entity_id = state.entity_id
             if attr in (ATTR_TEMPERATURE, ATTR_TARGET_TEMP_LOW, ATTR_TARGET_TEMP_HIGH):
                 member_offset = self._group._temp_offset_map.get(entity_id, 0.0)
                 effective_target = target_value + member_offset if target_value is not None else None
@@ -470,7 +472,7 @@ class BaseServiceCallHandler(ABC):
 
             # Float tolerance check
             if attr in (ATTR_TEMPERATURE, ATTR_TARGET_TEMP_LOW, ATTR_TARGET_TEMP_HIGH, ATTR_HUMIDITY):
-                if self._group.within_tolerance(current_value, effective_target):
+                if within_tolerance(current_value, effective_target):
                     continue
 
             if current_value != effective_target:
@@ -855,6 +857,8 @@ class BaseServiceCallHandler(ABC):
         action = self._group.config.get(CONF_UNION_OUT_OF_BOUNDS_ACTION, UnionOutOfBoundsAction.OFF)
 
         temp_attrs = (ATTR_TEMPERATURE, ATTR_TARGET_TEMP_LOW, ATTR_TARGET_TEMP_HIGH)
+        # Members capable of the target hvac_mode; resolved on first use, then shared by all calls
+        mode_capable: list[str] | None = None
 
         for call in calls:
             kwargs = call["kwargs"]
@@ -917,8 +921,9 @@ class BaseServiceCallHandler(ABC):
                     if entity_id in self._group.run_state.oob_members and state.state == HVACMode.OFF:
                         target_mode = self.target_state.hvac_mode
                         if target_mode and target_mode != HVACMode.OFF:
-                            capable = self._get_capable_entities(ATTR_HVAC_MODE, target_mode)
-                            if entity_id in capable:
+                            if mode_capable is None:
+                                mode_capable = self._get_capable_entities(ATTR_HVAC_MODE, target_mode)
+                            if entity_id in mode_capable:
                                 result.append({
                                     "service": SERVICE_SET_HVAC_MODE,
                                     "kwargs": {ATTR_HVAC_MODE: target_mode},
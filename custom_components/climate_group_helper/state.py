@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import logging
 import time
-from dataclasses import asdict, dataclass, field, fields, replace
+from dataclasses import dataclass, field, fields, replace
+from functools import cache
 from datetime import datetime, timedelta
 from types import MappingProxyType
 from typing import Any, Self, TYPE_CHECKING
@@ -25,6 +26,16 @@ if TYPE_CHECKING:
 _LOGGER = logging.getLogger(__name__)
 
 
+def within_tolerance(val1: Any, val2: Any, tolerance: float = FLOAT_TOLERANCE) -> bool:
+    """Check if two values are within a given tolerance."""
+    if type(val1) is float and type(val2) is float:
+        return abs(val1 - val2) < tolerance
+    try:
+        return abs(float(val1) - float(val2)) < tolerance
+    except (ValueError, TypeError):
+        return False
+
+
 @dataclass(frozen=True)
 class RunState:
     """Immutable operational status for the climate group.
@@ -85,7 +96,13 @@ class RunState:
         return replace(self, target_state_snapshot=None)
 
 
-@dataclass(frozen=True)
+@cache
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Return the dataclass field names of cls, resolved once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
+@dataclass(frozen=True, slots=True)
 class ClimateState:
     """Base class for climate state representations."""
     # Core Attributes
@@ -101,26 +118,31 @@ class ClimateState:
 
     def update(self, **kwargs: Any) -> Self:
         """Return a new state with updated values."""
-        valid_fields = {f.name for f in fields(self)}
+        valid_fields = _field_names(type(self))
         filtered_kwargs = {k: v for k, v in kwargs.items() if k in valid_fields}
         return replace(self, **filtered_kwargs)
 
     def to_dict(self, attributes: list[str] | None = None) -> dict[str, Any]:
         """Convert state to dictionary. Excludes None values."""
-        full = asdict(self)
-        if attributes is None:
-            return {k: v for k, v in full.items() if v is not None}
-        return {k: v for k, v in full.items() if k in attributes and v is not None}
+        # All fields hold scalars, so a shallow read matches asdict() without its deep copy
+        names = _field_names(type(self))
+        if attributes is not None:
+            names = [k for k in names if k in attributes]
+        return {k: v for k in names if (v := getattr(self, k)) is not None}
 
     def __repr__(self) -> str:
         """Only show attributes that are present."""
-        data = asdict(self)
+        data = {key: getattr(self, key) for key in _field_names(type(self))}
         filtered = {key: value for key, value in data.items() if value is not None and value != ""}
         attrs = ", ".join(f"{key}={repr(value)}" for key, value in filtered.items())
         return f"{self.__class__.__name__}({attrs})"
 
 
-@dataclass(frozen=True)
+# ClimateState field names, resolved once instead of calling fields() per use
+CLIMATE_STATE_FIELDS: tuple[str, ...] = _field_names(ClimateState)
+
+
+@dataclass(frozen=True, slots=True)
 class TargetState(ClimateState):
     """Current target state of the group with source metadata."""
     last_source: str | None = None
@@ -128,13 +150,13 @@ class TargetState(ClimateState):
     last_timestamp: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CurrentState(ClimateState):
     """Actual current state of the group (aggregated)."""
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FilterState(ClimateState):
     """Masking state for attribute access control."""
     hvac_mode: bool = True  # type: ignore[assignment]
@@ -150,14 +172,14 @@ class FilterState(ClimateState):
     @classmethod
     def from_keys(cls, attributes: list[str]) -> FilterState:
         """Create a FilterState with values set to True for the given attributes."""
-        data = {f.name: False for f in fields(cls)}
+        data = dict.fromkeys(_field_names(cls), False)
         for attr in attributes:
             if attr in data:
                 data[attr] = True
         return cls(**data)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChangeState(ClimateState):
     """Delta between a member's current state and the group's TargetState.
 
@@ -180,16 +202,9 @@ class ChangeState(ClimateState):
         if new_state is None or target_state is None:
             return cls(entity_id=entity_id)
 
-        def within_tolerance(val1: float, val2: float, tolerance: float = FLOAT_TOLERANCE) -> bool:
-            try:
-                return abs(float(val1) - float(val2)) < tolerance
-            except (ValueError, TypeError):
-                return False
-
         deviations: dict[str, Any] = {}
         # Iterate over ClimateState fields only — ignores ChangeState metadata (entity_id)
-        for f in fields(ClimateState):
-            key = f.name
+        for key in CLIMATE_STATE_FIELDS:
             target_val = getattr(target_state, key, None)
 
             # Apply per-member offset for temperature fields
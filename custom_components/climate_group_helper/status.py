@@ -1,6 +1,7 @@
 """Status and analytics aggregation for ClimateGroupHelper extra_state_attributes."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.climate import HVACMode
@@ -50,11 +51,31 @@ if TYPE_CHECKING:
     from .climate import ClimateGroupHelper
 
 
-def build_extra_state_attributes(group: ClimateGroupHelper) -> dict[str, Any]:
-    """Collect all status, analytics, and source data into a single dict."""
+def configured_features(config: Mapping[str, Any]) -> frozenset[str]:
+    """Return the features enabled purely by configuration.
+
+    These only change on a config entry reload, so the group resolves them once
+    at init instead of on every state write.
+    """
+    features: set[str] = set()
+    if config.get(CONF_WINDOW_MODE, WindowControlMode.DISABLED) != WindowControlMode.DISABLED:
+        features.add("window")
+    if config.get(CONF_PRESENCE_MODE, PresenceMode.DISABLED) != PresenceMode.DISABLED:
+        features.add("presence")
+    if config.get(CONF_ISOLATION_TRIGGER, IsolationTrigger.DISABLED) != IsolationTrigger.DISABLED:
+        features.add("isolation")
+    return frozenset(features)
+
+
+def build_extra_state_attributes(group: ClimateGroupHelper, attrs: dict[str, Any]) -> None:
+    """Refill attrs in place with all status, analytics, and source data.
+
+    The group keeps one dict for its lifetime instead of allocating a new one
+    per state write. Conditional keys are dropped by clearing it first.
+    """
     run_state = group.run_state
     target = group.shared_target_state
-    attrs: dict[str, Any] = {}
+    attrs.clear()
 
     # --- Always present ---
     attrs[ATTR_ASSUMED_STATE] = group._attr_assumed_state
@@ -120,23 +141,23 @@ def build_extra_state_attributes(group: ClimateGroupHelper) -> dict[str, Any]:
     # Configured features — always emitted (even as []) so the card knows the
     # attribute exists and can distinguish "not configured" from "not yet received".
     # Simple mode handlers are not initialised, so we guard handler access.
-    cfg = group.config
+    configured = group.configured_features
     features: list[str] = []
-    if cfg.get(CONF_WINDOW_MODE, WindowControlMode.DISABLED) != WindowControlMode.DISABLED:
+    if "window" in configured:
         features.append("window")
-    if cfg.get(CONF_PRESENCE_MODE, PresenceMode.DISABLED) != PresenceMode.DISABLED:
+    if "presence" in configured:
         features.append("presence")
     if group.advanced_mode and group.schedule_handler.schedule_entity_id:
         features.append("schedule")
     if group.advanced_mode and group.sync_mode_handler.sync_mode != SyncMode.DISABLED:
         features.append("sync")
-    if cfg.get(CONF_ISOLATION_TRIGGER, IsolationTrigger.DISABLED) != IsolationTrigger.DISABLED:
+    if "isolation" in configured:
         features.append("isolation")
     attrs[ATTR_ENABLED_FEATURES] = features
 
     # --- Advanced mode only ---
     if not group.advanced_mode:
-        return attrs
+        return
 
     # Effective sync config (resolves schedule overrides at call-time)
     attrs[ATTR_EFFECTIVE_SYNC_MODE] = group.sync_mode_handler.sync_mode
@@ -157,5 +178,3 @@ def build_extra_state_attributes(group: ClimateGroupHelper) -> dict[str, Any]:
         attrs[ATTR_ACTIVE_OVERRIDE] = run_state.active_override
     if run_state.active_override_end:
         attrs[ATTR_ACTIVE_OVERRIDE_END] = run_state.active_override_end.isoformat()
-
-    return attrs
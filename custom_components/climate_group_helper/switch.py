@@ -16,7 +16,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import DOMAIN
+from . import get_entry_group
 
 if TYPE_CHECKING:
     from .climate import ClimateGroupHelper
@@ -31,8 +31,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the main switch for each climate group."""
-    entry_data = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
-    group = entry_data.get("group")
+    group = get_entry_group(hass, config_entry)
 
     if not group:
         _LOGGER.warning("[%s] Climate group entity not found for config entry, skipping switch setup", config_entry.title)
@@ -5,7 +5,6 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
-from dataclasses import fields
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import Event
@@ -22,7 +21,7 @@ from .const import (
     SYNC_TARGET_ATTRS,
     SyncMode,
 )
-from .state import ClimateState, FilterState
+from .state import CLIMATE_STATE_FIELDS, FilterState
 
 if TYPE_CHECKING:
     from .climate import ClimateGroupHelper
@@ -144,18 +143,13 @@ class SyncModeHandler:
 
             # Block enforcement: each active blocking source enforces its own state.
             # Runs before the DISABLED guard so blocking is always enforced regardless
-            # of sync_mode. Each enforce_override() is a no-op if its source is inactive.
+            # of sync_mode.
             if self._group.run_state.blocking_sources:
-                for enforce in (
-                    self._group.switch_override_manager.enforce_override,
-                    self._group.window_override_manager.enforce_override,
-                    self._group.presence_override_manager.enforce_override,
-                ):
-                    task = self._hass.async_create_background_task(
-                        enforce(), name="climate_group_block_enforcement"
-                    )
-                    self._active_sync_tasks.add(task)
-                    task.add_done_callback(self._active_sync_tasks.discard)
+                task = self._hass.async_create_background_task(
+                    self._enforce_blocking_sources(), name="climate_group_block_enforcement"
+                )
+                self._active_sync_tasks.add(task)
+                task.add_done_callback(self._active_sync_tasks.discard)
 
         if not change_dict:
             return
@@ -193,6 +187,9 @@ class SyncModeHandler:
                 _LOGGER.debug("[%s] Ignoring setpoint changes while OFF", self._group.entity_id)
                 return
 
+        # Sync filter flags, built once per resync instead of once per changed key
+        sync_filter = self.filter_state.to_dict()
+
         # 1. Mirror mode: adopt filtered changes into target_state.
         # Guard: skip adoption on reconnect (old_state was unavailable/unknown) — the device
         # is reporting its restored hardware state, not a deliberate user change.
@@ -200,7 +197,7 @@ class SyncModeHandler:
         old_state = event.data.get("old_state")
         is_reconnect = old_state is not None and old_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN)
         if self.sync_mode in (SyncMode.MIRROR, SyncMode.MIRROR_LOCK) and not is_reconnect:
-            if filtered := {key: value for key, value in change_dict.items() if self.filter_state.to_dict().get(key)}:
+            if filtered := {key: value for key, value in change_dict.items() if sync_filter.get(key)}:
                 filtered = self._reverse_offset_temperatures(change_entity_id, filtered)
                 self.state_manager.update(entity_id=change_entity_id, **filtered)
                 _LOGGER.debug("[%s] TargetState updated: %s", self._group.entity_id, self.target_state)
@@ -222,7 +219,7 @@ class SyncModeHandler:
                 return
             master_id = self._group._master_entity_id
             if master_id and change_entity_id == master_id:
-                if filtered := {key: value for key, value in change_dict.items() if self.filter_state.to_dict().get(key)}:
+                if filtered := {key: value for key, value in change_dict.items() if sync_filter.get(key)}:
                     filtered = self._reverse_offset_temperatures(change_entity_id, filtered)
                     self.state_manager.update(entity_id=change_entity_id, **filtered)
                     _LOGGER.debug("[%s] Master entity change adopted: %s", self._group.entity_id, filtered)
@@ -238,6 +235,20 @@ class SyncModeHandler:
         else:
             _LOGGER.debug("[%s] Enforcement skipped (blocking mode)", self._group.entity_id)
 
+    async def _enforce_blocking_sources(self) -> None:
+        """Run every override manager's enforcement in one task.
+
+        Each enforce_override() is a no-op unless its source is active and no
+        higher-priority source (switch > window > presence) is, so at most one
+        of them sends calls and awaiting them in turn costs nothing.
+        """
+        for enforce in (
+            self._group.switch_override_manager.enforce_override,
+            self._group.window_override_manager.enforce_override,
+            self._group.presence_override_manager.enforce_override,
+        ):
+            await enforce()
+
     # --- Offset Helpers ---
 
     def _reverse_offset_temperatures(self, entity_id: str, data: dict[str, Any]) -> dict[str, Any]:
@@ -287,10 +298,12 @@ class SyncModeHandler:
             return True
         if new_state.state != old_state.state:
             return True
+        new_attrs = new_state.attributes
+        old_attrs = old_state.attributes
         return any(
-            new_state.attributes.get(f.name) != old_state.attributes.get(f.name)
-            for f in fields(ClimateState)
-            if f.name != "hvac_mode"
+            new_attrs.get(key) != old_attrs.get(key)
+            for key in CLIMATE_STATE_FIELDS
+            if key != "hvac_mode"
         )
 
     def _is_transient_state_event(self, event: Event) -> bool: